@@ -1,20 +1,47 @@
 import os
-import requests
-import pandas as pd
-# pandas-ta is no longer needed!
-import json
+import asyncio
+import httpx
+import numpy as np
+import orjson
 import time
+import random
 import argparse
-from typing import Dict, Any, Optional, List
-
-# Optional: load environment variables from a local .env file when available
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except Exception:
-    # dotenv is optional; if it's not installed, environment variables
-    # will be read from the OS environment as usual.
-    pass
+import functools
+import types
+import hashlib
+from typing import Dict, Any, Optional, List, NamedTuple
+
+# Optional: load environment variables from a local .env file when available.
+# Skipped when the key is already in the environment, so no extra import is paid.
+if not os.environ.get("GEMINI_API_KEY"):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except Exception:
+        # dotenv is optional; if it's not installed, environment variables
+        # will be read from the OS environment as usual.
+        pass
+
+def lazy_njit(func):
+    """
+    Optional: JIT-compile `func` with numba when available.
+    numba is slow to import, so the import and compilation are deferred to the
+    first call instead of slowing down CLI startup.
+    """
+    compiled = None
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal compiled
+        if compiled is None:
+            try:
+                from numba import njit
+                compiled = njit(cache=True)(func)
+            except ImportError:
+                # numba is optional; without it the function runs as plain Python.
+                compiled = func
+        return compiled(*args, **kwargs)
+    return wrapper
 
 # --- Configuration ---
 # Your API key is read from an environment variable for security
@@ -24,6 +51,20 @@ API_KEY = os.environ.get("GEMINI_API_KEY")
 # callers can supply the key via env, .env, or CLI arg without requiring import-time globals.
 GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-09-2025:generateContent"
 COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
+# Default headers for every request; both APIs exchange JSON
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+# Fail fast on unreachable hosts, but give Gemini (which may run a search) time to answer.
+# A stalled socket raises httpx.TimeoutException, which is retried with backoff.
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=3.05)
+
+# CoinGecko responses are cached to avoid re-downloading the same data (and hitting 429s).
+# The daily history changes slowly, so it is cached on disk.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "crypto_agent")
+HISTORY_CACHE_TTL = 60 * 60  # seconds
+
+# Technical indicator windows, in daily closes
+SMA_PERIOD = 20
+RSI_PERIOD = 14
 
 # --- ANSI Color Codes for Readability ---
 class Colors:
@@ -36,42 +77,67 @@ class Colors:
 
 # --- 1. Robust API Call Helpers ---
 
-def fetch_with_backoff(url: str, method: str = 'GET', payload: Optional[Dict[str, Any]] = None, retries: int = 3, delay: int = 2) -> requests.Response:
+def create_session() -> httpx.AsyncClient:
     """
-    A robust fetch function with exponential backoff for retries.
-    Handles 'GET' and 'POST' requests.
+    Creates the pooled HTTP/2 client shared by every API call.
+    Keep-alive connections are reused so later calls skip the TCP + TLS handshake,
+    and concurrent requests to the same host are multiplexed over one connection.
+    Redirects are followed, as they were with requests and aiohttp.
     """
-    headers = {'Content-Type': 'application/json'}
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    return httpx.AsyncClient(http2=True, limits=limits, timeout=_HTTP_TIMEOUT, headers=_JSON_HEADERS,
+                             follow_redirects=True)
+
+async def fetch_with_backoff(session: httpx.AsyncClient, url: str, method: str = 'GET', payload: Optional[Dict[str, Any]] = None, retries: int = 3, delay: int = 2) -> Any:
+    """
+    A robust async fetch function with exponential backoff for retries.
+    Handles 'GET' and 'POST' requests and returns the decoded JSON body.
+    Random jitter is added to each wait so concurrent callers that fail together
+    do not retry in lockstep; a numeric Retry-After header takes precedence, capped
+    at the longest wait of the backoff schedule.
+    """
+    # Resolve the method and serialize the body once up front instead of on every retry
+    is_post = method.upper() == 'POST'
+    body = orjson.dumps(payload) if payload is not None else None
+    max_wait = delay * 2 ** (retries - 1)
     for i in range(retries):
+        wait = delay + random.uniform(0, delay * 0.5)
         try:
-            if method.upper() == 'POST':
-                response = requests.post(url, headers=headers, json=payload)
+            if is_post:
+                response = await session.post(url, content=body)
             else:
-                response = requests.get(url, headers=headers)
-            
+                response = await session.get(url)
+
             # 429: Too Many Requests, 5xx: Server Errors
             if response.status_code == 429 or (response.status_code >= 500 and response.status_code <= 599):
-                print(f"{Colors.YELLOW}Retryable error: {response.status_code}. Retrying in {delay}s...{Colors.ENDC}")
-                time.sleep(delay)
-                delay *= 2 # Exponential backoff
-                continue
-            
-            response.raise_for_status() # Raise an HTTPError for bad responses (4xx, 5xx)
-            return response
-        
-        except requests.exceptions.RequestException as e:
+                if i == retries - 1:
+                    print(f"{Colors.RED}Fetch failed after all retries: {response.status_code}{Colors.ENDC}")
+                    break
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    wait = min(int(retry_after), max_wait)
+                print(f"{Colors.YELLOW}Retryable error: {response.status_code}. Retrying in {wait:.1f}s...{Colors.ENDC}")
+            else:
+                response.raise_for_status() # Raise an HTTPStatusError for bad responses (4xx, 5xx)
+                return orjson.loads(response.content)
+
+        except httpx.HTTPError as e:
+            # Includes timeouts and connection errors as well as HTTPStatusError
             if i == retries - 1:
                 print(f"{Colors.RED}Fetch failed after all retries: {e}{Colors.ENDC}")
                 raise
-            time.sleep(delay)
-            delay *= 2
+
+        await asyncio.sleep(wait)
+        delay *= 2 # Exponential backoff
     raise Exception("Fetch failed after all retries.")
 
 
-def call_gemini_api(user_prompt: str, 
-                    system_prompt: Optional[str] = None, 
-                    tools: Optional[List[Dict[str, Any]]] = None, 
-                    schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+
+async def call_gemini_api(session: httpx.AsyncClient,
+                          user_prompt: str,
+                          system_prompt: Optional[str] = None, 
+                          tools: Optional[List[Dict[str, Any]]] = None,
+                          schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     A generic function to call the Gemini API, handling tools, 
     system prompts, and structured output schemas.
@@ -99,8 +165,7 @@ def call_gemini_api(user_prompt: str,
             "responseSchema": schema
         }
 
-    response = fetch_with_backoff(gemini_url, method='POST', payload=payload)
-    result = response.json()
+    result = await fetch_with_backoff(session, gemini_url, method='POST', payload=payload)
 
     candidate = result.get("candidates", [{}])[0]
     content_part = candidate.get("content", {}).get("parts", [{}])[0]
@@ -113,7 +178,93 @@ def call_gemini_api(user_prompt: str,
 
 # --- 2. RAG - Data Retrieval Functions ---
 
-def fetch_market_data(crypto_id: str) -> Dict[str, Any]:
+class TechData(NamedTuple):
+    """Latest market price and technical indicators for a coin."""
+    current_price: float
+    latest_sma: float
+    latest_rsi: float
+
+@lazy_njit
+def _wilder_rsi(prices: np.ndarray, period: int = 14) -> float:
+    """
+    Returns the latest RSI of `prices` using Wilder's smoothing: the average gain/loss
+    is seeded with the mean of the first `period` moves, then updated incrementally.
+    """
+    deltas = np.diff(prices)
+    # Split moves into gains and losses with clamping instead of masked copies
+    gains = np.maximum(deltas, 0.0)
+    losses = np.maximum(-deltas, 0.0)
+    avg_gain = gains[:period].mean()
+    avg_loss = losses[:period].mean()
+
+    for i in range(period, deltas.shape[0]):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+
+    if avg_loss == 0.0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+# Set once the RSI JIT warm-up has been scheduled, so it only ever runs once per process
+_rsi_jit_primed = False
+
+def _prime_rsi_jit() -> None:
+    """
+    Runs _wilder_rsi on a throwaway series so numba is imported and the kernel compiled
+    before real data arrives. Warm-up is only an optimization, so failures are reported
+    and ignored; the real call will surface any genuine problem.
+    """
+    try:
+        _wilder_rsi(np.zeros(RSI_PERIOD + 1, dtype=np.float64), RSI_PERIOD)
+    except Exception as e:
+        print(f"{Colors.YELLOW}Warning: Could not pre-compile the RSI calculation. Error: {e}{Colors.ENDC}")
+
+def _read_history_cache(cache_path: str) -> Optional[Dict[str, Any]]:
+    """Returns the cached history at `cache_path` if it is fresh enough, else None."""
+    try:
+        if time.time() - os.path.getmtime(cache_path) < HISTORY_CACHE_TTL:
+            with open(cache_path, 'rb') as f:
+                return orjson.loads(f.read())
+    except (OSError, ValueError):
+        # A missing or unreadable cache entry simply means we fetch fresh data
+        pass
+    return None
+
+def _write_history_cache(cache_path: str, history_data: Dict[str, Any]) -> None:
+    """Stores `history_data` at `cache_path`, ignoring file system errors."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            f.write(orjson.dumps(history_data))
+    except OSError:
+        # Caching is best-effort; an unwritable cache dir must not fail the analysis
+        pass
+
+async def fetch_price_history(session: httpx.AsyncClient, crypto_id: str) -> Dict[str, Any]:
+    """
+    Fetches the 90-day daily price history from CoinGecko.
+    Responses are cached on disk per coin and reused for up to HISTORY_CACHE_TTL seconds.
+    The blocking cache file I/O runs in the default thread pool so it does not stall
+    the other requests in flight on the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    # One file per coin, overwritten on refresh; the mtime TTL decides freshness.
+    # The id is hashed so arbitrary user input maps to a distinct, safe file name.
+    id_hash = hashlib.sha256(crypto_id.encode('utf-8')).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{id_hash}.json")
+    history_data = await loop.run_in_executor(None, _read_history_cache, cache_path)
+    if history_data is not None:
+        return history_data
+
+    history_url = f"{COINGECKO_BASE_URL}/coins/{crypto_id}/market_chart?vs_currency=usd&days=90&interval=daily"
+    history_data = await fetch_with_backoff(session, history_url)
+    # Only the prices are used; drop market caps and volumes so the cached file,
+    # and every later read of it, is a third of the size
+    history_data = {"prices": history_data["prices"]}
+    await loop.run_in_executor(None, _write_history_cache, cache_path, history_data)
+    return history_data
+
+async def fetch_market_data(session: httpx.AsyncClient, crypto_id: str) -> TechData:
     """
     Fetches market data from CoinGecko and calculates technical indicators.
     Demonstrates the 'Retrieval' part of RAG with technical data.
@@ -122,46 +273,44 @@ def fetch_market_data(crypto_id: str) -> Dict[str, Any]:
     """
     print(f"{Colors.BLUE}... 1. Fetching market data for '{crypto_id}'...{Colors.ENDC}")
     try:
-        # 1. Fetch 90-day historical data
-        history_url = f"{COINGECKO_BASE_URL}/coins/{crypto_id}/market_chart?vs_currency=usd&days=90&interval=daily"
-        history_response = fetch_with_backoff(history_url)
-        history_data = history_response.json()
+        # 1. Fetch 90-day historical data.
+        # On the first call, prime the RSI JIT in a worker thread meanwhile, so
+        # numba's import and compile overlap the network wait instead of following it.
+        global _rsi_jit_primed
+        tasks = [fetch_price_history(session, crypto_id)]
+        if not _rsi_jit_primed:
+            _rsi_jit_primed = True
+            tasks.append(asyncio.get_running_loop().run_in_executor(None, _prime_rsi_jit))
+        history_data = (await asyncio.gather(*tasks))[0]
+
+        # 2. Keep only the closing prices; the timestamps are never used.
+        # The last entry is CoinGecko's most recent price, so no separate price request is needed.
+        closes = np.asarray([p[1] for p in history_data['prices']], dtype=np.float64)
+        # The SMA needs SMA_PERIOD closes; the RSI needs RSI_PERIOD moves to seed plus
+        # one to smooth, i.e. RSI_PERIOD + 2 closes
+        min_closes = max(SMA_PERIOD, RSI_PERIOD + 2)
+        if len(closes) < min_closes:
+            raise ValueError(f"Not enough price history for '{crypto_id}': need at least {min_closes} daily points, got {len(closes)}.")
+        current_price = float(closes[-1])
+
+        # 3. Calculate TA indicators with NumPy; only the latest values are needed
 
-        # 2. Fetch current price
-        price_url = f"{COINGECKO_BASE_URL}/simple/price?ids={crypto_id}&vs_currencies=usd"
-        price_response = fetch_with_backoff(price_url)
-        price_data = price_response.json()
+        # Calculate 20-Day SMA
+        latest_sma = float(closes[-SMA_PERIOD:].mean())
 
-        # 3. Process data with Pandas
-        df = pd.DataFrame(history_data['prices'], columns=['timestamp', 'close'])
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        # Calculate 14-Day RSI (Wilder's smoothing)
+        latest_rsi = float(_wilder_rsi(closes, RSI_PERIOD))
 
-        # 4. Calculate TA indicators using just pandas
-        
-        # Calculate 20-Day SMA
-        df['SMA_20'] = df['close'].rolling(window=20).mean()
-        
-        # Calculate 14-Day RSI
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        df['RSI_14'] = 100 - (100 / (1 + rs))
-
-        # Get the most recent non-NaN values for indicators
-        latest_sma = df['SMA_20'].dropna().iloc[-1]
-        latest_rsi = df['RSI_14'].dropna().iloc[-1]
-
-        return {
-            "current_price": price_data[crypto_id]['usd'],
-            "latest_sma": latest_sma,
-            "latest_rsi": latest_rsi,
-        }
+        return TechData(
+            current_price=current_price,
+            latest_sma=latest_sma,
+            latest_rsi=latest_rsi,
+        )
     except Exception as e:
         print(f"{Colors.RED}Error fetching market data: {e}{Colors.ENDC}")
         raise
 
-def fetch_news_sentiment(crypto_name: str) -> str:
+async def fetch_news_sentiment(session: httpx.AsyncClient, crypto_name: str) -> str:
     """
     Fetches real-time news headlines using Gemini with Google Search.
     Demonstrates the 'Retrieval' part of RAG with real-world news.
@@ -171,7 +320,7 @@ def fetch_news_sentiment(crypto_name: str) -> str:
         prompt = f"Find the top 3-5 recent news headlines for {crypto_name} and provide a one-sentence summary of the overall sentiment (positive, negative, or neutral)."
         tools = [{"google_search": {}}]
         
-        response_part = call_gemini_api(prompt, tools=tools)
+        response_part = await call_gemini_api(session, prompt, tools=tools)
         return response_part['text']
     
     except Exception as e:
@@ -180,32 +329,52 @@ def fetch_news_sentiment(crypto_name: str) -> str:
 
 # --- 3. Agent, RAG, and Structured Output Function ---
 
-def get_ai_analysis(crypto_name: str, tech_data: Dict[str, Any], news_sentiment: str) -> Dict[str, str]:
+# The Agent's persona and the Structured Output schema never change between calls,
+# so they are built once at import time rather than on every analysis.
+_ANALYST_SYSTEM_PROMPT = """
+You are an expert crypto analyst. Your analysis must be concise, unbiased, 
+and directly reference the data provided. Return your analysis *only*
+in the following JSON format. Do not include any other text or markdown formatting.
+"""
+
+_ANALYSIS_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "analysis": {
+            "type": "STRING",
+            "description": "A concise 2-3 sentence analysis synthesizing the technical data and news."
+        },
+        "recommendation": {
+            "type": "STRING",
+            "description": "A clear recommendation: 'Strong Buy', 'Buy', 'Hold', 'Sell', or 'Strong Sell'."
+        },
+        "confidence": {
+            "type": "STRING",
+            "description": "'High', 'Medium', or 'Low' confidence in the recommendation."
+        }
+    },
+    "required": ["analysis", "recommendation", "confidence"]
+}
+
+async def get_ai_analysis(session: httpx.AsyncClient, crypto_name: str, tech_data: TechData, news_sentiment: str) -> Dict[str, str]:
     """
     Calls the Gemini API to perform the final analysis.
     
     Demonstrates:
-    - Agent: Via the 'system_prompt'.
+    - Agent: Via the '_ANALYST_SYSTEM_PROMPT'.
     - RAG: By 'augmenting' the prompt with 'tech_data' and 'news_sentiment'.
-    - Structured Output: Via the 'schema'.
+    - Structured Output: Via the '_ANALYSIS_SCHEMA'.
     """
     print(f"{Colors.BLUE}... 3. Consulting AI Analyst Agent...{Colors.ENDC}")
 
-    # 1. Define the Agent's persona
-    system_prompt = """
-    You are an expert crypto analyst. Your analysis must be concise, unbiased, 
-    and directly reference the data provided. Return your analysis *only*
-    in the following JSON format. Do not include any other text or markdown formatting.
-    """
-
-    # 2. Define the RAG prompt
+    # Define the RAG prompt
     user_prompt = f"""
     Analyze the market for {crypto_name}.
 
     Here is the live data:
-    - Current Price: ${tech_data['current_price']:.2f}
-    - 20-Day SMA: ${tech_data['latest_sma']:.2f}
-    - 14-Day RSI: {tech_data['latest_rsi']:.2f}
+    - Current Price: ${tech_data.current_price:.2f}
+    - 20-Day SMA: ${tech_data.latest_sma:.2f}
+    - 14-Day RSI: {tech_data.latest_rsi:.2f}
 
     Here is the latest news sentiment:
     "{news_sentiment}"
@@ -215,33 +384,13 @@ def get_ai_analysis(crypto_name: str, tech_data: Dict[str, Any], news_sentiment:
     - If RSI > 70, it's overbought (bearish). If RSI < 30, it's oversold (bullish).
     - Synthesize these technical signals with the news sentiment for a final recommendation.
     """
-    
-    # 3. Define the Structured Output schema
-    schema = {
-        "type": "OBJECT",
-        "properties": {
-            "analysis": {
-                "type": "STRING",
-                "description": "A concise 2-3 sentence analysis synthesizing the technical data and news."
-            },
-            "recommendation": {
-                "type": "STRING",
-                "description": "A clear recommendation: 'Strong Buy', 'Buy', 'Hold', 'Sell', or 'Strong Sell'."
-            },
-            "confidence": {
-                "type": "STRING",
-                "description": "'High', 'Medium', or 'Low' confidence in the recommendation."
-            }
-        },
-        "required": ["analysis", "recommendation", "confidence"]
-    }
 
     try:
-        response_part = call_gemini_api(user_prompt, system_prompt=system_prompt, schema=schema)
+        response_part = await call_gemini_api(session, user_prompt, system_prompt=_ANALYST_SYSTEM_PROMPT, schema=_ANALYSIS_SCHEMA)
         # The API returns the JSON as a string, so we parse it.
-        return json.loads(response_part['text'])
+        return orjson.loads(response_part['text'])
     
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"{Colors.RED}Error: AI returned invalid JSON.{Colors.ENDC}")
         print(f"Raw response: {response_part.get('text', 'N/A')}")
         raise
@@ -251,47 +400,51 @@ def get_ai_analysis(crypto_name: str, tech_data: Dict[str, Any], news_sentiment:
 
 # --- 4. Main Execution ---
 
-def run_analysis():
+# Simple mapping for user convenience: map common symbols to CoinGecko IDs
+# Each entry maps input -> (coin_id_for_api, DisplayName); keys are casefolded.
+# Built once and exposed read-only so it cannot be mutated between runs.
+_CRYPTO_MAP = types.MappingProxyType({
+    "bitcoin": ("bitcoin", "Bitcoin"),
+    "btc": ("bitcoin", "Bitcoin"),
+    "ethereum": ("ethereum", "Ethereum"),
+    "eth": ("ethereum", "Ethereum"),
+    "solana": ("solana", "Solana"),
+    "sol": ("solana", "Solana"),
+    "dogecoin": ("dogecoin", "Dogecoin"),
+    "doge": ("dogecoin", "Dogecoin")
+})
+
+async def run_analysis():
     """
     Main function to run the crypto analysis agent.
     """
-    # Simple mapping for user convenience: map common symbols to CoinGecko IDs
-    # Each entry maps input -> (coin_id_for_api, DisplayName)
-    crypto_map = {
-        "bitcoin": ("bitcoin", "Bitcoin"),
-        "btc": ("bitcoin", "Bitcoin"),
-        "ethereum": ("ethereum", "Ethereum"),
-        "eth": ("ethereum", "Ethereum"),
-        "solana": ("solana", "Solana"),
-        "sol": ("solana", "Solana"),
-        "dogecoin": ("dogecoin", "Dogecoin"),
-        "doge": ("dogecoin", "Dogecoin")
-    }
-
     try:
-        crypto_input = input(f"Enter a crypto ID or symbol (e.g., 'bitcoin' or 'btc'): ").lower().strip()
+        crypto_input = input(f"Enter a crypto ID or symbol (e.g., 'bitcoin' or 'btc'): ").casefold().strip()
         if not crypto_input:
             print(f"{Colors.RED}No input provided. Exiting.{Colors.ENDC}")
             return
 
         # Resolve to CoinGecko id + display name (fallback: use the input as id)
-        coin_id, crypto_name = crypto_map.get(crypto_input, (crypto_input, crypto_input.capitalize()))
+        coin_id, crypto_name = _CRYPTO_MAP.get(crypto_input, (crypto_input, crypto_input.capitalize()))
         print(f"\n{Colors.BOLD}Analyzing {crypto_name}...{Colors.ENDC}")
 
-        # 1. RAG - Get technical data (use resolved CoinGecko id)
-        tech_data = fetch_market_data(coin_id)
-        
-        # 2. RAG - Get news data
-        news_sentiment = fetch_news_sentiment(crypto_name)
-        
-        # 3. Agent + RAG + Structured Output - Get AI analysis
-        ai_report = get_ai_analysis(crypto_name, tech_data, news_sentiment)
+        # A single session is shared by every call so connections are reused
+        async with create_session() as session:
+            # 1. RAG - Get technical data (use resolved CoinGecko id) and
+            # 2. RAG - Get news data, concurrently since both are I/O-bound
+            tech_data, news_sentiment = await asyncio.gather(
+                fetch_market_data(session, coin_id),
+                fetch_news_sentiment(session, crypto_name),
+            )
+
+            # 3. Agent + RAG + Structured Output - Get AI analysis
+            ai_report = await get_ai_analysis(session, crypto_name, tech_data, news_sentiment)
         
         # 4. Print the final report
         print(f"\n{Colors.GREEN}--- Live Technical Data ---{Colors.ENDC}")
-        print(f"  {Colors.BOLD}Current Price:{Colors.ENDC} ${tech_data['current_price']:,.2f}")
-        print(f"  {Colors.BOLD}20-Day SMA:{Colors.ENDC}    ${tech_data['latest_sma']:,.2f}")
-        print(f"  {Colors.BOLD}14-Day RSI:{Colors.ENDC}     {tech_data['latest_rsi']:.2f}")
+        print(f"  {Colors.BOLD}Current Price:{Colors.ENDC} ${tech_data.current_price:,.2f}")
+        print(f"  {Colors.BOLD}20-Day SMA:{Colors.ENDC}    ${tech_data.latest_sma:,.2f}")
+        print(f"  {Colors.BOLD}14-Day RSI:{Colors.ENDC}     {tech_data.latest_rsi:.2f}")
         
         print(f"\n{Colors.GREEN}--- AI Analyst Report ---{Colors.ENDC}")
         print(f"  {Colors.BOLD}Analysis:{Colors.ENDC}       {ai_report['analysis']}")
@@ -315,4 +468,4 @@ if __name__ == "__main__":
         print(f"{Colors.RED}{Colors.BOLD}Error: GEMINI_API_KEY not provided.{Colors.ENDC}")
         print("Run with: `py crypto_agent.py --api-key YOUR_KEY` or set the environment variable GEMINI_API_KEY.")
     else:
-        run_analysis()
\ No newline at end of file
+        asyncio.run(run_analysis())
\ No newline at end of file